@@ -28,6 +28,7 @@ class AppConfig(BaseSettings):
     DATA_DIR: str = "./data/"
     DB_FILE: str = os.path.join(DATA_DIR, "db.sqlite")
     DEBUG: bool = False
+    MAX_QUEUE: int = 100
     SPEED_RATIO: float = 33 / 45
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
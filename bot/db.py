@@ -1,45 +1,78 @@
 import sqlite3
 
+import aiosqlite
+from async_lru import alru_cache
+
 from bot.config import config
 from bot.utils.logger import get_logger
 
 log = get_logger()
 
+_connection: aiosqlite.Connection | None = None  # pylint: disable=invalid-name
+
+CACHE_SIZE = 1024
+CACHE_TTL = 30  # In seconds
+
 
 class Error(Exception):
     """Custom exception class for database."""
 
 
-def sqlite_connect(db_file: str) -> sqlite3.Connection:
+async def sqlite_connect(db_file: str) -> aiosqlite.Connection:
     """Connect to the database file."""
 
     try:
-        conn = sqlite3.connect(db_file, check_same_thread=False)
-        conn.execute("pragma journal_mode=wal;")
+        conn = aiosqlite.connect(db_file)
+        conn.daemon = True  # Don't keep the process alive if never closed
+        await conn
+        await conn.executescript(
+            """PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;"""
+        )
         return conn
     except sqlite3.Error as error:
         log.critical("Can't connect to the database - %s", error)
         raise error
 
 
-def send_query(query: str, args: tuple | None = None) -> sqlite3.Cursor:  # type: ignore
+async def get_connection() -> aiosqlite.Connection:
+    """Returns the shared database connection, opens it on first use."""
+
+    global _connection  # pylint: disable=global-statement
+
+    if _connection is None:
+        _connection = await sqlite_connect(config.DB_FILE)
+    return _connection
+
+
+async def close() -> None:
+    """Close the shared database connection."""
+
+    global _connection  # pylint: disable=global-statement
+
+    if _connection is not None:
+        await _connection.close()
+        _connection = None
+
+
+async def send_query(query: str, args: tuple | None = None) -> aiosqlite.Cursor:  # type: ignore
     """Send query to database and return cursor object."""
 
     if not args:
         args = tuple()
 
-    with sqlite_connect(config.DB_FILE) as conn:
-        cursor = conn.cursor()
-        try:
-            cursor.execute(query, args)
-            conn.commit()
-        except sqlite3.Error as error:
-            log.error("Can't send query to the database - %s", error)
-            raise error
-        return cursor
+    conn = await get_connection()
+    try:
+        cursor = await conn.execute(query, args)
+        await conn.commit()
+    except sqlite3.Error as error:
+        log.error("Can't send query to the database - %s", error)
+        raise error
+    return cursor
 
 
-def execute_script(script_file: str):
+async def execute_script(script_file: str):
     """Execute SQL script from file."""
 
     try:
@@ -49,14 +82,13 @@ def execute_script(script_file: str):
         log.critical("Can't read from SQL script file: %s", error)
         raise SystemExit from error
 
-    with sqlite_connect(config.DB_FILE) as conn:
-        cursor = conn.cursor()
-        try:
-            cursor.executescript(sql)
-            conn.commit()
-        except sqlite3.Error as error:
-            log.error("Can't send query to the database - %s", error)
-            raise error
+    conn = await get_connection()
+    try:
+        await conn.executescript(sql)
+        await conn.commit()
+    except sqlite3.Error as error:
+        log.error("Can't send query to the database - %s", error)
+        raise error
 
 
 async def insert_match(
@@ -68,7 +100,7 @@ async def insert_match(
 ) -> int | None:
     """Insert row with original and slowed file ids."""
 
-    query = send_query(
+    query = await send_query(
         """INSERT INTO
         match (original, slowed, user_id, private, forbidden)
         VALUES (?, ?, ?, ?, ?);""",
@@ -80,23 +112,25 @@ async def insert_match(
             forbidden,
         ),
     )
+    get_match.cache_invalidate(original)
     return query.lastrowid
 
 
+@alru_cache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
 async def get_match(original: str) -> tuple | None:
     """Get row of pair original and slowed file ids."""
 
-    query = send_query(
+    query = await send_query(
         "SELECT * FROM match WHERE original = ?;",
         (original,),
     )
-    return query.fetchone()
+    return await query.fetchone()
 
 
 async def get_random_match() -> tuple | None:
     """Get random row from match table."""
 
-    query = send_query(
+    query = await send_query(
         """SELECT * FROM match
         WHERE private = ? AND forbidden = ?
         ORDER BY RANDOM() LIMIT 1;""",
@@ -105,48 +139,58 @@ async def get_random_match() -> tuple | None:
             False,
         ),
     )
-    return query.fetchone()
+    return await query.fetchone()
 
 
+@alru_cache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
 async def get_by_pk(table: str, pk: int) -> tuple | None:
     """Get the row by its id from a given table."""
 
-    query = send_query(
+    query = await send_query(
         f"SELECT * FROM {table} WHERE id = ?;",
         (pk,),
     )
-    return query.fetchone()
+    return await query.fetchone()
+
+
+def clear_match_cache() -> None:
+    """Drop cached rows of the match table after they were changed."""
+
+    get_match.cache_clear()
+    get_by_pk.cache_clear()
 
 
 async def toggle_private(idc: int, is_private: bool = True) -> None:
     """Toggle private status for slowed row."""
 
-    send_query(
+    await send_query(
         "UPDATE match SET private = ? WHERE id = ?;",
         (
             is_private,
             idc,
         ),
     )
+    clear_match_cache()
 
 
 async def toggle_forbidden(idc: int, is_forbidden: bool = True) -> None:
     """Toggle forbidden status for slowed row."""
 
-    send_query(
+    await send_query(
         "UPDATE match SET forbidden = ? WHERE id = ?;",
         (
             is_forbidden,
             idc,
         ),
     )
+    clear_match_cache()
 
 
 async def toggle_like(toggle: bool, match_id: int, user_id: int) -> None:
     """Toggle likes for /random audio."""
 
     if toggle:
-        send_query(
+        await send_query(
             "INSERT OR IGNORE INTO likes (match_id, user_id) VALUES (?, ?);",
             (
                 match_id,
@@ -154,7 +198,7 @@ async def toggle_like(toggle: bool, match_id: int, user_id: int) -> None:
             ),
         )
     else:
-        send_query(
+        await send_query(
             "DELETE FROM likes WHERE match_id = ? AND user_id = ?;",
             (
                 match_id,
@@ -162,11 +206,21 @@ async def toggle_like(toggle: bool, match_id: int, user_id: int) -> None:
             ),
         )
 
+    _is_liked.cache_invalidate(int(match_id), int(user_id))
+
 
 async def is_liked(match_id: int, user_id: int) -> bool:
     """Check if audio is already liked."""
 
-    query = send_query(
+    # Callback data holds ids as strings, so normalize the cache key
+    return await _is_liked(int(match_id), int(user_id))
+
+
+@alru_cache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+async def _is_liked(match_id: int, user_id: int) -> bool:
+    """Check if audio is already liked. Results are cached."""
+
+    query = await send_query(
         "SELECT * FROM likes WHERE match_id = ? AND user_id = ?;",
         (
             match_id,
@@ -174,27 +228,27 @@ async def is_liked(match_id: int, user_id: int) -> bool:
         ),
     )
 
-    return bool(query.fetchone())
+    return bool(await query.fetchone())
 
 
 async def get_queue_count(user_id: int) -> int:
     """Returns cout of task in queue for user."""
 
-    query = send_query(
+    query = await send_query(
         "SELECT * FROM queue WHERE user_id = ?;",
         (user_id,),
     )
 
-    if row := query.fetchone():
+    if row := await query.fetchone():
         return row[2]
 
     return 0
 
 
-async def inc_queue_count(user_id: int) -> sqlite3.Cursor:
+async def inc_queue_count(user_id: int) -> aiosqlite.Cursor:
     """Increase count for queue of user tasks."""
 
-    return send_query(
+    return await send_query(
         """INSERT OR REPLACE INTO queue
         VALUES (
             NULL,
@@ -205,10 +259,10 @@ async def inc_queue_count(user_id: int) -> sqlite3.Cursor:
     )
 
 
-async def dec_queue_count(user_id: int) -> sqlite3.Cursor:
+async def dec_queue_count(user_id: int) -> aiosqlite.Cursor:
     """Decrease count for queue of user tasks."""
 
-    return send_query(
+    return await send_query(
         """INSERT OR REPLACE INTO queue
         VALUES (
             NULL,
@@ -228,7 +282,7 @@ async def dec_queue_count(user_id: int) -> sqlite3.Cursor:
 async def add_user(user_id: int, username: str) -> None:
     """Add new user to database."""
 
-    send_query(
+    await send_query(
         """INSERT OR IGNORE INTO
         users (user_id, username)
         VALUES (?, ?);""",
@@ -242,21 +296,21 @@ async def add_user(user_id: int, username: str) -> None:
 async def users_count() -> int:
     """Returns count of users in database."""
 
-    query = send_query("""SELECT COUNT(id) FROM users;""")
-    return query.fetchone()[0]
+    query = await send_query("""SELECT COUNT(id) FROM users;""")
+    return (await query.fetchone())[0]
 
 
 async def slowed_count() -> int:
     """Returns count of slowed audios in database."""
 
-    query = send_query("""SELECT COUNT(id) FROM match;""")
-    return query.fetchone()[0]
+    query = await send_query("""SELECT COUNT(id) FROM match;""")
+    return (await query.fetchone())[0]
 
 
 async def random_count() -> int:
     """Returns count of public audios in database."""
 
-    query = send_query(
+    query = await send_query(
         """SELECT COUNT(id) FROM match WHERE private = 0 and forbidden = 0;"""
     )
-    return query.fetchone()[0]
+    return (await query.fetchone())[0]
@@ -4,41 +4,38 @@ from aiogram import Dispatcher, types
 from aiogram.utils.exceptions import FileIsTooBig, MessageNotModified
 
 from bot import keyboards
-from bot.utils.exceptions import QueueLimitReached, NotSupportedFormat
+from bot.utils.exceptions import AudioIsTooLong, QueueIsFull, QueueLimitReached, NotSupportedFormat
 from bot.utils.logger import get_logger
 
 from .audio import processing_audio
+from .callbacks import (
+    RANDOM_ACTIONS,
+    SHARE_ACTIONS,
+    random_callback,
+    share_callback,
+)
 from .commands import (
     command_random,
     command_start,
-    next_random,
     command_help,
     command_about,
 )
 from .common import answer_message
 from .errors import (
+    audio_is_too_long,
     database_error,
     file_is_too_big,
     global_error_handler,
     message_not_modified_error,
+    queue_is_full,
     queue_limit_reached,
     not_supported_format,
 )
-from .likes import toggle_like
 from .report import (
-    report_confiramtion_help,
-    report_confiramtion_no,
-    report_confiramtion_yes,
     report_confirmation,
     report_response_accept,
     report_response_decline,
 )
-from .share import (
-    share_confiramtion_help,
-    share_confiramtion_no,
-    share_confiramtion_yes,
-    share_confirmation,
-)
 
 log = get_logger()
 
@@ -52,6 +49,10 @@ def register_handlers(dp: Dispatcher):
         file_is_too_big,
         exception=FileIsTooBig,
     )
+    dp.register_errors_handler(
+        audio_is_too_long,
+        exception=AudioIsTooLong,
+    )
     dp.register_errors_handler(
         not_supported_format,
         exception=NotSupportedFormat,
@@ -68,6 +69,10 @@ def register_handlers(dp: Dispatcher):
         queue_limit_reached,
         exception=QueueLimitReached,
     )
+    dp.register_errors_handler(
+        queue_is_full,
+        exception=QueueIsFull,
+    )
     dp.register_errors_handler(
         global_error_handler, exception=Exception
     )  # Should be last among errors handlers
@@ -95,48 +100,20 @@ def register_handlers(dp: Dispatcher):
 
     # Share callback handlers
     dp.register_callback_query_handler(
-        share_confirmation,
-        keyboards.share_cbd.filter(action="confirm"),
-    )
-    dp.register_callback_query_handler(
-        share_confiramtion_help,
-        keyboards.share_cbd.filter(action="help"),
-    )
-    dp.register_callback_query_handler(
-        share_confiramtion_no,
-        keyboards.share_cbd.filter(action="no"),
-    )
-    dp.register_callback_query_handler(
-        share_confiramtion_yes,
-        keyboards.share_cbd.filter(action="yes"),
+        share_callback,
+        keyboards.share_cbd.filter(action=list(SHARE_ACTIONS)),
     )
 
-    # Report callback handlers
+    # Report confirmation has its own handler to be protected by throttling
     dp.register_callback_query_handler(
         report_confirmation,
         keyboards.random_cbd.filter(action="confirm"),
     )
-    dp.register_callback_query_handler(
-        report_confiramtion_help,
-        keyboards.random_cbd.filter(action="help"),
-    )
-    dp.register_callback_query_handler(
-        report_confiramtion_no,
-        keyboards.random_cbd.filter(action="no"),
-    )
-    dp.register_callback_query_handler(
-        report_confiramtion_yes,
-        keyboards.random_cbd.filter(action="yes"),
-    )
 
-    # Likes and Next callback handlers
-    dp.register_callback_query_handler(
-        toggle_like,
-        keyboards.random_cbd.filter(action="toggle_like"),
-    )
+    # Report, Likes and Next callback handlers
     dp.register_callback_query_handler(
-        next_random,
-        keyboards.random_cbd.filter(action="next"),
+        random_callback,
+        keyboards.random_cbd.filter(action=list(RANDOM_ACTIONS)),
     )
 
     # Report response callback handlers
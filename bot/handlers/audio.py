@@ -1,5 +1,9 @@
+import asyncio
+import io
 import os
+import time
 
+import aiofiles.os
 from aiogram import types
 from aiogram.types.mixins import Downloadable
 from aiogram.utils.exceptions import FileIsTooBig, TelegramAPIError
@@ -8,19 +12,29 @@ from bot import db, keyboards
 from bot.config import config
 from bot.utils import audio
 from bot.utils.brand import get_branded_file_name, get_caption
-from bot.utils.exceptions import NotSupportedFormat, QueueLimitReached
+from bot.utils.exceptions import (
+    AudioIsTooLong,
+    NotSupportedFormat,
+    QueueIsFull,
+    QueueLimitReached,
+)
 from bot.utils.logger import get_logger
+from bot.utils.tagging import Tagging
 
 log = get_logger()
 
+MAX_AUDIO_SIZE = 20 << 20  # 20 MB, Bot API download limit
+MAX_AUDIO_DURATION = 900  # In seconds
+UPLOAD_ACTION_THRESHOLD = 1.0  # In seconds
+
 
 async def processing_audio(message: types.Message):
     """Slow down uploaded audio track and send it to user."""
 
     await message.answer_chat_action(types.ChatActions.TYPING)
 
-    # Check file for size limit (20mb)
-    if message.audio.file_size >= (20 * 1024 * 1024):
+    # Check file for size limit
+    if (message.audio.file_size or 0) >= MAX_AUDIO_SIZE:
         raise FileIsTooBig(message.audio.file_size)
 
     # Check file for supported format
@@ -44,6 +58,10 @@ async def processing_audio(message: types.Message):
             reply_markup=keyboard,
         )
 
+    # Don't let long audio hold the workers for minutes
+    if (message.audio.duration or 0) > MAX_AUDIO_DURATION:
+        raise AudioIsTooLong(message.audio.duration)
+
     queue = message.bot.data["queue"]
     queue_count = await queue.get_user_queue(message.from_user.id)
     if queue_count >= config.TASK_LIMIT:
@@ -52,7 +70,11 @@ async def processing_audio(message: types.Message):
     await queue.inc_user_queue(message.from_user.id)
 
     # Add slowing down audio task to the queue
-    task = queue.enqueue(slowing_down_task, message)
+    try:
+        task = queue.enqueue(slowing_down_task, message)
+    except QueueIsFull:
+        await queue.dec_user_queue(message.from_user.id)
+        raise
 
     if task > 1:
         await message.reply(
@@ -65,20 +87,33 @@ async def slowing_down_task(message: types.Message) -> bool:
     """Slowing down audio Task."""
 
     queue = message.bot.data["queue"]
-    info_message = await message.reply(
-        "💿 Start recording at 33 rpm for you...",
-        disable_notification=True,
+
+    try:
+        info_message = await message.reply(
+            "💿 Start recording at 33 rpm for you...",
+            disable_notification=True,
+        )
+    except TelegramAPIError:
+        await queue.dec_user_queue(message.from_user.id)
+        raise
+
+    # Measured from RECORD_AUDIO action, which Telegram shows for about 5 sec
+    started = time.monotonic()
+
+    # Chat action is only cosmetic, so its failure must not stop the task
+    _, downloaded = await asyncio.gather(
+        message.answer_chat_action(types.ChatActions.RECORD_AUDIO),
+        download_file(message.audio),
+        return_exceptions=True,
     )
 
-    if not (downloaded := await download_file(message.audio)):
+    if not isinstance(downloaded, str):
         await info_message.edit_text(
             "💾 Can't download your file. Please try again or come back later."
         )
         await queue.dec_user_queue(message.from_user.id)
         return False
 
-    await message.answer_chat_action(types.ChatActions.RECORD_AUDIO)
-
     if not (slowed := await audio.slow_down(downloaded, config.SPEED_RATIO)):
         await info_message.edit_text(
             (
@@ -89,17 +124,24 @@ async def slowing_down_task(message: types.Message) -> bool:
         await queue.dec_user_queue(message.from_user.id)
         return False
 
-    await message.answer_chat_action(types.ChatActions.UPLOAD_AUDIO)
+    # Recording status is still shown if download and processing were fast
+    if time.monotonic() - started > UPLOAD_ACTION_THRESHOLD:
+        await message.answer_chat_action(types.ChatActions.UPLOAD_AUDIO)
 
     try:
         file_name = await get_branded_file_name(
             message.audio.file_name or message.audio.file_unique_id
         )
-        thumb_file_exists = os.path.exists(config.ALBUM_ART)
+        thumb = Tagging.get_image_file(config.ALBUM_ART)
         tags = {
-            "performer": message.audio.to_python().get("performer"),
-            "title": message.audio.to_python().get("title"),
-            "thumb": types.InputFile(config.ALBUM_ART) if thumb_file_exists else None,
+            "performer": message.audio.performer,
+            "title": message.audio.title,
+            "thumb": types.InputFile(
+                io.BytesIO(thumb),
+                filename=os.path.basename(config.ALBUM_ART),
+            )
+            if thumb
+            else None,
         }
         uploaded = await message.answer_audio(
             types.InputFile(slowed, filename=file_name),
@@ -119,7 +161,7 @@ async def slowing_down_task(message: types.Message) -> bool:
         return True
 
     except TelegramAPIError as error:
-        log.error(error)
+        log.error("Can't send slowed audio - %s", error)
         await info_message.edit_text(
             (
                 f"🤷‍♂️ I'm sorry {message.from_user.username}, "
@@ -130,8 +172,8 @@ async def slowing_down_task(message: types.Message) -> bool:
 
     finally:
         await queue.dec_user_queue(message.from_user.id)
-        os.remove(downloaded)
-        os.remove(slowed)
+        await aiofiles.os.remove(downloaded)
+        await aiofiles.os.remove(slowed)
 
 
 async def download_file(obj: Downloadable, **kwargs) -> str | None:
@@ -151,6 +193,6 @@ async def download_file(obj: Downloadable, **kwargs) -> str | None:
 
         return downloaded.name
     except Exception as error:  # pylint: disable=broad-except
-        log.error(error)
+        log.error("Can't download file - %s", error)
 
     return None
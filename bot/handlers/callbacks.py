@@ -0,0 +1,42 @@
+from aiogram import types
+
+from .commands import next_random
+from .likes import toggle_like
+from .report import (
+    report_confiramtion_help,
+    report_confiramtion_no,
+    report_confiramtion_yes,
+)
+from .share import (
+    share_confiramtion_help,
+    share_confiramtion_no,
+    share_confiramtion_yes,
+    share_confirmation,
+)
+
+SHARE_ACTIONS = {
+    "confirm": share_confirmation,
+    "help": share_confiramtion_help,
+    "no": share_confiramtion_no,
+    "yes": share_confiramtion_yes,
+}
+
+RANDOM_ACTIONS = {
+    "help": report_confiramtion_help,
+    "no": report_confiramtion_no,
+    "yes": report_confiramtion_yes,
+    "toggle_like": toggle_like,
+    "next": next_random,
+}
+
+
+async def share_callback(query: types.CallbackQuery, callback_data: dict):
+    """Dispatch Share buttons callback to the handler of its action."""
+
+    return await SHARE_ACTIONS[callback_data["action"]](query, callback_data)
+
+
+async def random_callback(query: types.CallbackQuery, callback_data: dict):
+    """Dispatch /random buttons callback to the handler of its action."""
+
+    return await RANDOM_ACTIONS[callback_data["action"]](query, callback_data)
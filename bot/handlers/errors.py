@@ -30,6 +30,18 @@ async def file_is_too_big(update: types.Update, _error: Exception):
     return True
 
 
+async def audio_is_too_long(update: types.Update, _error: Exception):
+    """Error handler for AudioIsTooLong exception."""
+
+    log.info(
+        "Audio is too long <file_id=%s duration=%d>",
+        update.message.audio.file_id,
+        update.message.audio.duration,
+    )
+    await update.message.reply("⏱ Audio is too long. Max duration is 15 minutes.")
+    return True
+
+
 async def not_supported_format(update: types.Update, _error: Exception):
     """Error handler for NotSupportedFormat exception."""
 
@@ -56,7 +68,7 @@ async def database_error(update: types.Update, _error: Exception):
 async def message_not_modified_error(_update: types.Update, error: Exception):
     """Error handler for MessageNotModified exception."""
 
-    log.warning(error)
+    log.warning("%s", error)
     return True
 
 
@@ -75,3 +87,16 @@ async def queue_limit_reached(update: types.Update, error: Exception):
         )
     )
     return True
+
+
+async def queue_is_full(update: types.Update, error: Exception):
+    """Error handler for QueueIsFull exception."""
+
+    log.warning("The queue is full. Max size: %s", error)
+    await update.message.reply(
+        (
+            "🚦 I'm too busy right now. "
+            "Please send me your audio again in a few minutes."
+        )
+    )
+    return True
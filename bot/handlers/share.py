@@ -1,9 +1,15 @@
-import json
-
 from aiogram import types
 
 from bot import db, keyboards
 
+# Callback data keeps booleans as strings: str(bool) or int from database
+STR_TO_BOOL = {
+    "True": True,
+    "False": False,
+    "1": True,
+    "0": False,
+}
+
 
 async def share_confirmation(query: types.CallbackQuery, callback_data: dict):
     """Display confirm Share buttons."""
@@ -15,8 +21,7 @@ async def share_confirmation(query: types.CallbackQuery, callback_data: dict):
             "Sorry! This audio is forbidden to share.", show_alert=True
         )
 
-    # TODO: refactor this - string to boolean conversion
-    is_private = json.loads(callback_data["is_private"].lower())
+    is_private = STR_TO_BOOL[callback_data["is_private"]]
 
     text = (
         "Are you sure to make this audio public?"
@@ -50,9 +55,8 @@ async def share_confiramtion_help(query: types.CallbackQuery, callback_data: dic
 async def share_confiramtion_no(query: types.CallbackQuery, callback_data: dict):
     """Handler for selection NO at Share confiramtion."""
 
-    # TODO: refactor this - string to boolean conversion
-    is_private = json.loads(callback_data["is_private"].lower())
-    is_random = json.loads(callback_data["is_random"].lower())
+    is_private = STR_TO_BOOL[callback_data["is_private"]]
+    is_random = STR_TO_BOOL[callback_data["is_random"]]
 
     await query.message.edit_reply_markup(
         keyboards.share_button(
@@ -77,8 +81,7 @@ async def share_confiramtion_yes(query: types.CallbackQuery, callback_data: dict
                 show_alert=True,
             )
 
-        # TODO: refactor this - string to boolean conversion
-        is_random = json.loads(callback_data["is_random"].lower())
+        is_random = STR_TO_BOOL[callback_data["is_random"]]
 
         await db.toggle_private(idc, not is_private)
         await query.message.edit_reply_markup(
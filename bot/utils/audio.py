@@ -1,4 +1,11 @@
 import asyncio
+import multiprocessing
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from functools import lru_cache
+
+from aiogram.utils.exceptions import TelegramAPIError
+from mutagen import MutagenError
+from sox.core import SoxError
 
 from bot.config import config
 from bot.utils.logger import get_logger
@@ -8,6 +15,34 @@ from .soxex import ExtTransformer
 
 log = get_logger()
 
+# Sox processing runs in a separate process to keep the event loop free.
+# The queue runs one task at a time, so a single worker is enough.
+_executor: ProcessPoolExecutor | None = None  # pylint: disable=invalid-name
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Returns the audio processing pool, creates it on first use."""
+
+    global _executor  # pylint: disable=global-statement
+
+    if _executor is None:
+        # Forking the multi-threaded bot process is unsafe, use a clean one
+        _executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the audio processing pool. Next use creates a new one."""
+
+    global _executor  # pylint: disable=global-statement
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
 
 async def slow_down(file_path: str, speed: float = 33 / 45) -> str | None:
     """This function slow down audio file."""
@@ -15,40 +50,64 @@ async def slow_down(file_path: str, speed: float = 33 / 45) -> str | None:
     slowed_file_path = f"{file_path[:-4]}_slow.mp3"
 
     try:
-        chain = ExtTransformer()
-        chain.upsample(1)
-        chain.speed(speed)
-        chain.norm(-1)
-        chain.highpass(50)
-        chain.bass(1)
-        # chain.equalizer(85, 1, 5)  # bass boost
-        # chain.equalizer(120, 1, 5)  # bass boost
-        chain.reverb(
-            reverberance=70,
-            high_freq_damping=10,
-            room_scale=100,
-            stereo_depth=50,
-        )
-        chain.lowpass(16000)
-        chain.fade(fade_out_len=1)
-
-        # Run function in separate thread to non-blocking stack
-        await asyncio.to_thread(
-            chain.build,
-            input_filepath=file_path,
-            output_filepath=slowed_file_path,
-            bitrate=320.0,
+        await asyncio.get_running_loop().run_in_executor(
+            get_executor(),
+            _slow_down_sync,
+            file_path,
+            slowed_file_path,
+            speed,
         )
+    except BrokenExecutor as error:
+        # Worker process died, replace the pool for the next tasks
+        log.error("Audio processing pool is broken, restarting - %s", error)
+        shutdown_executor()
+        return None
+    except (SoxError, OSError, ValueError) as error:
+        log.error("Can't slow down audio %s - %s", file_path, error)
+        return None
 
+    # Tags are optional, the slowed audio is usable without them
+    try:
         await fill_id3_tags(file_path, slowed_file_path)
-
-    except Exception as error:  # pylint: disable=broad-except
-        log.error(error)
-        slowed_file_path = None
+    except (MutagenError, TelegramAPIError) as error:
+        log.warning("Can't fill ID3 tags to %s - %s", slowed_file_path, error)
 
     return slowed_file_path
 
 
+def _slow_down_sync(file_path: str, slowed_file_path: str, speed: float) -> None:
+    """Applies the slowing down effects chain to the audio file by sox."""
+
+    get_chain(speed).apply(
+        input_filepath=file_path,
+        output_filepath=slowed_file_path,
+        bitrate=320.0,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_chain(speed: float) -> ExtTransformer:
+    """Returns the slowing down effects chain. It is built once per speed."""
+
+    chain = ExtTransformer()
+    chain.speed(speed)
+    chain.norm(-1)
+    chain.highpass(50)
+    chain.bass(1)
+    # chain.equalizer(85, 1, 5)  # bass boost
+    # chain.equalizer(120, 1, 5)  # bass boost
+    chain.reverb(
+        reverberance=70,
+        high_freq_damping=10,
+        room_scale=100,
+        stereo_depth=50,
+    )
+    chain.lowpass(16000)
+    chain.fade(fade_out_len=1)
+
+    return chain
+
+
 async def fill_id3_tags(src_path: str, dst_path: str) -> None:
     """
     It opies the ID3 tags from the source file to the destination file,
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 from aiogram import Bot
 
@@ -7,7 +8,7 @@ async def get_bot_mention() -> str:
     """Returns mention to Bot."""
 
     bot = Bot.get_current()
-    bot_info = await bot.get_me()
+    bot_info = await bot.me  # Requested once and cached by aiogram
     return f"@{bot_info.username}"
 
 
@@ -22,6 +23,13 @@ async def get_branded_file_name(full_path: str) -> str:
     """Returns name of the audio file with Bot name and extension."""
 
     mention = await get_bot_mention()
+    return brand_file_name(full_path, mention)
+
+
+@lru_cache(maxsize=256)
+def brand_file_name(full_path: str, mention: str) -> str:
+    """Returns name of the audio file with given mention and extension."""
+
     file_name = os.path.splitext(full_path)[0]
     return f"{file_name} {mention}.mp3"
 
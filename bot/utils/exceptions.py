@@ -10,5 +10,13 @@ class QueueLimitReached(AppException):
     """This exception is raised when the queue limit is reached."""
 
 
+class QueueIsFull(AppException):
+    """This exception is raised when the global queue is full."""
+
+
+class AudioIsTooLong(AppException):
+    """This exception is raised when audio duration exceeds the limit."""
+
+
 class NotSupportedFormat(AppException):
     """This exception is raised when audio format is not equal to MP3."""
@@ -4,6 +4,7 @@ import asyncio
 from aioredis import Redis
 
 from bot.config import config
+from bot.utils.exceptions import QueueIsFull
 from bot.utils.logger import get_logger
 from bot.utils.redis import RedisClient
 
@@ -65,10 +66,19 @@ class Queue:
         self.__running = False
 
     def enqueue(self, func, *args, **kwargs) -> int:
-        """Add a task into the queue."""
+        """
+        Add a task into the queue. Raises QueueIsFull
+        if the queue has reached its maximum size.
+        """
+
+        coro = func(*args, **kwargs)
+        try:
+            self.__queue.put_nowait(coro)
+        except asyncio.QueueFull as error:
+            coro.close()  # Prevent "coroutine was never awaited" warning
+            raise QueueIsFull(self.__queue.maxsize) from error
 
         self.__size += 1
-        self.__queue.put_nowait(func(*args, **kwargs))
         log.debug("Task #%d added to the queue %s", self.count, func)
         return self.__size
 
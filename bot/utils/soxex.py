@@ -73,15 +73,68 @@ class ExtTransformer(Transformer):
             raise ValueError("output_filepath is not specified!")
 
         # set output parameters
+        file_info.validate_output_file(output_filepath)
+
+        args = self._build_args(
+            input_filepath,
+            output_filepath,
+            bitrate,
+            self._input_format_args(input_format),
+        )
+
+        if extra_args is not None:
+            if not isinstance(extra_args, list):
+                raise ValueError("extra_args must be a list.")
+            args.extend(extra_args)
+
+        status, out, err = self._run(args, output_filepath, input_array)
+
+        if return_output:
+            return status, out, err
+
+        return True
+
+    def apply(self, input_filepath, output_filepath, bitrate=None):
+        """
+        Creates an output_file on disk from the input file by executing
+        the current set of commands. Unlike build, the input file is not
+        probed and the transformer state is never changed, so the same
+        chain can be applied to many files. Returns True on success.
+
+        Parameters
+        ----------
+        input_filepath : str
+            Path to input audio file.
+        output_filepath : str
+            Path to desired output file. If a file already exists at
+            the given path, the file will be overwritten.
+        bitrate : float
+            Bitrate of output file or None.
+
+        Returns
+        -------
+        status : bool
+            True on success.
+        """
+
+        args = self._build_args(input_filepath, output_filepath, bitrate)
+        self._run(args, output_filepath)
+
+        return True
+
+    def _build_args(
+        self, input_filepath, output_filepath, bitrate=None, input_format_args=None
+    ):
+        """Returns sox arguments list for the current set of commands."""
+
         if input_filepath == output_filepath:
             raise ValueError(
                 "input_filepath must be different from output_filepath."
             )
-        file_info.validate_output_file(output_filepath)
 
         args = []
         args.extend(self.globals)
-        args.extend(self._input_format_args(input_format))
+        args.extend(input_format_args or [])
         args.append(input_filepath)
         args.extend(self._output_format_args(self.output_format))
 
@@ -93,10 +146,10 @@ class ExtTransformer(Transformer):
         args.append(output_filepath)
         args.extend(self.effects)
 
-        if extra_args is not None:
-            if not isinstance(extra_args, list):
-                raise ValueError("extra_args must be a list.")
-            args.extend(extra_args)
+        return args
+
+    def _run(self, args, output_filepath, input_array=None):
+        """Executes sox with given arguments and raises SoxError on fail."""
 
         status, out, err = sox(args, input_array, True)
         if status != 0:
@@ -108,7 +161,4 @@ class ExtTransformer(Transformer):
             " ".join(self.effects_log),
         )
 
-        if return_output:
-            return status, out, err
-
-        return True
+        return status, out, err
@@ -9,6 +9,8 @@ log = get_logger()
 class Tagging:
     """MP3 ID3 tagging class."""
 
+    __images: dict[str, bytes | None] = {}
+
     def __init__(self, file_path: str) -> None:
         self.__file_path = file_path
         try:
@@ -72,18 +74,24 @@ class Tagging:
 
         return False
 
-    @staticmethod
-    def get_image_file(file_path: str) -> bytes | None:
+    @classmethod
+    def get_image_file(cls, file_path: str) -> bytes | None:
         """
         If the file exists, read it and return the bytes,
-        otherwise return None.
+        otherwise return None. The result is cached, so the file
+        is read from disk at most once.
         """
 
+        if file_path in cls.__images:
+            return cls.__images[file_path]
+
         try:
             with open(file_path, "rb") as raw:
-                return raw.read()
+                cls.__images[file_path] = raw.read()
+                return cls.__images[file_path]
         except IOError as error:
             log.warning("Can't read image file %s - %s", file_path, error)
+            cls.__images[file_path] = None
 
         return None
 
@@ -4,10 +4,16 @@ from aiogram import Bot, Dispatcher, executor, types
 from aiogram.contrib.fsm_storage.redis import RedisStorage2
 from aiogram.utils.executor import start_webhook
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from bot import db
 from bot.config import config
 from bot.handlers import register_handlers
 from bot.middlewares.throttling import ThrottlingMiddleware
+from bot.utils import audio
 from bot.utils.logger import get_logger
 from bot.utils.queue import Queue
 
@@ -18,7 +24,14 @@ async def on_startup(dp: Dispatcher):
     """Execute function before Bot start polling."""
 
     log.info("Execute startup Bot functions...")
-    db.execute_script("./schema.sql")
+
+    # Run new tasks synchronously until their first suspension (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(
+            asyncio.eager_task_factory  # type: ignore
+        )
+
+    await db.execute_script("./schema.sql")
 
     # Set webhook
     if config.USE_WEBHOOK:
@@ -34,7 +47,7 @@ async def on_startup(dp: Dispatcher):
     await dp.bot.set_my_commands(commands)
 
     # Starts loop worker for the queue
-    dp.bot.data.update(queue=await Queue.create())
+    dp.bot.data.update(queue=await Queue.create(maxsize=config.MAX_QUEUE))
     asyncio.create_task(dp.bot.data["queue"].start())
 
 
@@ -43,8 +56,15 @@ async def on_shutdown(dp: Dispatcher):
 
     log.info("Execute shutdown Bot functions...")
 
-    # Close Queue connection
-    await dp.bot.data["queue"].stop()
+    # Close database connection
+    await db.close()
+
+    # Close Queue connection, it is missing if startup has failed
+    if queue := dp.bot.data.get("queue"):
+        await queue.stop()
+
+    # Stop audio processing workers
+    audio.shutdown_executor()
 
     # Close storage
     await dp.storage.close()
@@ -61,6 +81,10 @@ async def on_shutdown(dp: Dispatcher):
 def main():
     """Main app runner."""
 
+    # Replace default asyncio event loop with the faster libuv-based one
+    if uvloop is not None:
+        uvloop.install()
+
     protected_handlers = [
         "answer_message",
         "report_confirmation",